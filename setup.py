@@ -32,11 +32,14 @@ setup(
         "boto3",
         "langchain_aws",
         "langchain_openai",
-        "s3path",
         "omegaconf",
+        "pyyaml",
         "pydantic_settings",
         "python-dotenv",
     ],
+    extras_require={
+        "cache": ["langchain_community"],
+    },
     python_requires=">=3.9",
     include_package_data=True,
     package_data={
@@ -2,6 +2,7 @@
 LLM Factory Pattern - A package for dynamically loading LLM providers and models.
 """
 
+from .caching import enable_response_cache
 from .config_models import ModelConfig, Provider
 from .exceptions import ModelConfigurationError, ModelNotFoundError
 from .model_config import get_default_config_dir, get_default_configs
@@ -18,5 +19,6 @@ __all__ = [
     "ModelConfig",
     "get_default_config_dir",
     "get_default_configs",
+    "enable_response_cache",
     "__version__",
 ]
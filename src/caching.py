@@ -0,0 +1,35 @@
+from typing import Optional
+
+from langchain_core.globals import set_llm_cache
+
+from exceptions import ModelConfigurationError
+
+# Database path of the currently installed response cache, if any
+_enabled_path: Optional[str] = None
+
+
+def enable_response_cache(database_path: str = ".llm_cache.sqlite") -> None:
+    """Cache LLM responses in a SQLite database shared by all models.
+
+    Once enabled, repeated identical prompts sent to the same model are answered from
+    the cache instead of calling the provider API. Calling this again with the path
+    that is currently enabled is a no-op.
+
+    Args:
+        database_path: The path of the SQLite database file holding the responses.
+    """
+    global _enabled_path
+    if database_path == _enabled_path:
+        return
+
+    try:
+        from langchain_community.cache import SQLiteCache
+    except ImportError as e:
+        raise ModelConfigurationError(
+            "Response caching requires 'langchain_community'; "
+            "install it with `pip install llm_factory[cache]`."
+        ) from e
+
+    set_llm_cache(SQLiteCache(database_path=database_path))
+    _enabled_path = database_path
+    print(f"LLM response cache enabled at: {database_path}")
@@ -1,8 +1,7 @@
 from enum import Enum
-from token import OP
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings
 
 
@@ -17,7 +16,8 @@ class ModelConfig(BaseModel):
     """Pydantic model for a single LLM configuration."""
 
     name: str
-    provider: Union[Provider, str]  # Can be either enum or string for custom providers
+    # Lowercase provider key: a built-in Provider value or a custom provider name
+    provider: str
     model_id: str
     region_name: Optional[str] = None
     api_key_secret_name: Optional[str] = None
@@ -32,6 +32,14 @@ class ModelConfig(BaseModel):
     temperature: float = Field(0.7, ge=0.0, le=2.0)
     description: Optional[str] = None
 
+    @field_validator("provider", mode="before")
+    @classmethod
+    def _normalize_provider(cls, value: Any) -> Any:
+        """Store the provider as a plain lowercase string usable as a registry key."""
+        if isinstance(value, Provider):
+            value = value.value
+        return value.lower() if isinstance(value, str) else value
+
 
 class AllModelsConfig(BaseModel):
     """Pydantic model for the entire collection of LLM configurations."""
@@ -43,6 +51,12 @@ class EnvSettings(BaseSettings):
     SSM_PROVIDER_PATH_PARAMETER: Optional[str] = "/LLM_CONFIG/PROVIDER_MODULES_S3_PATH"
     SSM_MODELS_PATH_PARAMETER: Optional[str] = "/LLM_CONFIG/MODELS_CONFIG_S3_PATH"
     OPENAI_API_KEY: Optional[str] = None
+    # Set to false to always reload and revalidate model configurations
+    LLM_CONFIG_CACHE_ENABLED: bool = True
+    # Directory for validated model config caches; defaults to the config directory
+    LLM_CONFIG_CACHE_DIR: Optional[str] = None
+    # Path of a SQLite database to cache LLM responses in; caching is off when unset
+    LLM_RESPONSE_CACHE: Optional[str] = None
 
 
 env = EnvSettings()
@@ -2,7 +2,9 @@
 Package containing default model configurations.
 """
 
+from functools import lru_cache
 from pathlib import Path
+from typing import Tuple
 
 
 def get_default_config_dir() -> str:
@@ -10,7 +12,12 @@ def get_default_config_dir() -> str:
     return str(Path(__file__).resolve().parent)
 
 
-def get_default_configs() -> list[str]:
-    """Get a list of default configuration files."""
+@lru_cache(maxsize=1)
+def get_default_configs() -> Tuple[str, ...]:
+    """Get the default configuration files.
+
+    The shipped configurations do not change at runtime, so the listing is computed
+    once and returned as an immutable tuple.
+    """
     config_dir = get_default_config_dir()
-    return [str(f) for f in Path(config_dir).glob("*.yaml")]
+    return tuple(str(f) for f in Path(config_dir).glob("*.yaml"))
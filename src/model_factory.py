@@ -1,229 +1,558 @@
+import hashlib
 import importlib.util
+import inspect
+import json
+import os
 import tempfile
-from functools import lru_cache
-from pathlib import Path
-from typing import Dict, Optional, Type
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
+from pathlib import Path, PurePosixPath
+from types import ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+from urllib.parse import urlparse
 
 import boto3
-from omegaconf import DictConfig, OmegaConf
-from pydantic import ValidationError
-from s3path import S3Path
+import yaml
+from botocore.config import Config as BotoConfig
+from pydantic import TypeAdapter, ValidationError
 
+from caching import enable_response_cache
 from config_models import AllModelsConfig, ModelConfig, Provider, env
 from exceptions import ModelConfigurationError, ModelNotFoundError
 from model_config import get_default_config_dir
-from models.base_model import BaseLlmModel
+from models.base_model import BaseLlmModel, clear_llm_cache
 from models.bedrock import LangChainBedrockModel
 from models.openai import LangChainOpenAIModel
+from path_utils import clear_glob_cache, glob_cached
+
+if TYPE_CHECKING:
+    from mypy_boto3_s3 import S3Client
+    from mypy_boto3_s3.type_defs import ObjectTypeDef
+    from mypy_boto3_ssm import SSMClient
+
+try:
+    # libyaml-backed loader, considerably faster than the pure-Python one
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Validated configurations are cached in the local config directory under this name
+CONFIG_CACHE_FILE = ".llm_factory_cache.json"
+# Compiled once and reused to validate every model configuration
+MODEL_CONFIG_ADAPTER = TypeAdapter(ModelConfig)
+# Maximum number of concurrent S3 downloads
+S3_MAX_WORKERS = 32
+
+
+def _has_interpolation(raw_configs: Any) -> bool:
+    """Whether raw (unresolved) configs contain OmegaConf `${...}` interpolations."""
+    return "${" in json.dumps(raw_configs, default=str)
+
+
+def _parse_s3_dir(s3_dir: str) -> Tuple[str, str]:
+    """Split an S3 directory (`s3://bucket/prefix/` or `/bucket/prefix/`) into its
+    bucket and key prefix."""
+    parsed = urlparse(s3_dir)
+    if parsed.scheme == "s3":
+        bucket, prefix = parsed.netloc, parsed.path.lstrip("/")
+    else:
+        bucket, _, prefix = parsed.path.lstrip("/").partition("/")
+    if prefix and not prefix.endswith("/"):
+        prefix += "/"
+    return bucket, prefix
+
+
+def _list_s3_dir(s3_dir: str, suffix: str) -> List["ObjectTypeDef"]:
+    """List the objects directly inside an S3 directory whose key ends with `suffix`.
+
+    Returns:
+        The `list_objects_v2` summaries (Key, ETag, LastModified, ...) of the objects.
+
+    Raises:
+        NotADirectoryError: If nothing exists under the directory prefix.
+    """
+    bucket, prefix = _parse_s3_dir(s3_dir)
+    paginator = _s3_client().get_paginator("list_objects_v2")
+    objects: List["ObjectTypeDef"] = []
+    is_dir = False
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter="/"):
+        is_dir = is_dir or page.get("KeyCount", 0) > 0
+        objects.extend(
+            obj for obj in page.get("Contents", []) if obj["Key"].endswith(suffix)
+        )
+    if not is_dir:
+        raise NotADirectoryError(f"S3 path '{s3_dir}' is not a directory.")
+    return objects
+
+
+def _s3_bulk_read(bucket: str, keys: List[str]) -> Dict[str, bytes]:
+    """Download S3 objects concurrently.
+
+    Returns:
+        A mapping of object key to content, in the same order as `keys`.
+    """
+    s3_client = _s3_client()
+
+    def read(key: str) -> bytes:
+        return s3_client.get_object(Bucket=bucket, Key=key)["Body"].read()
+
+    with ThreadPoolExecutor(max_workers=S3_MAX_WORKERS) as executor:
+        return dict(zip(keys, executor.map(read, keys)))
+
+
+# Built-in provider type (str) to model class mapping
+BUILTIN_PROVIDERS: Dict[str, Type[BaseLlmModel]] = {
+    Provider.BEDROCK.value: LangChainBedrockModel,
+    Provider.OPENAI.value: LangChainOpenAIModel,
+}
+
+
+@cache
+def _s3_client() -> "S3Client":
+    """Lazily create the S3 client shared by all S3 listings and downloads.
+
+    The connection pool is sized for `S3_MAX_WORKERS` concurrent downloads.
+    """
+    return boto3.client("s3", config=BotoConfig(max_pool_connections=S3_MAX_WORKERS))
+
+
+@cache
+def _ssm_client() -> "SSMClient":
+    """Lazily create the SSM client shared by all parameter lookups."""
+    return boto3.client("ssm")
+
+
+def _fetch_ssm_parameter(parameter_name: str, required: bool = False) -> str:
+    """Fetch a parameter value from SSM Parameter Store
+
+    Args:
+        parameter_name: The name of the SSM parameter
+        required: If True, raises an exception when parameter cannot be retrieved
+
+    Returns:
+        The parameter value or empty string if not found and not required
+    """
+    try:
+        response = _ssm_client().get_parameter(
+            Name=parameter_name,
+            WithDecryption=True,
+        )
+        return response.get("Parameter", {}).get("Value", "")
+    except Exception as e:
+        error_msg = f"Failed to load parameter '{parameter_name}' from SSM: {e}"
+        if required:
+            raise ModelConfigurationError(error_msg)
+        print(f"Warning: {error_msg}")
+        return ""
+
+
+def _resolve_ssm_s3_dir(
+    param_name: Optional[str], *, what: str, required: bool
+) -> Optional[str]:
+    """Resolve an SSM parameter (whose name is provided in env) into an S3 dir path.
+
+    Args:
+        param_name: Name of the SSM parameter to look up (from environment).
+        what: Human description of what this S3 path is for (e.g., "provider modules").
+        required: If True, raise ModelConfigurationError when unavailable/empty; otherwise, log and return None.
+
+    Returns:
+        The S3 directory path string if available, else None.
+    """
+    if not param_name:
+        msg = f"SSM parameter name for {what} not set in env;"
+        if required:
+            raise ModelConfigurationError(f"{msg} cannot proceed")
+        print(f"{msg} skipping")
+        return None
+
+    value = _fetch_ssm_parameter(param_name, required=required)
+    if not value:
+        msg = f"SSM parameter '{param_name}' for {what} returned empty;"
+        if required:
+            raise ModelConfigurationError(msg + " cannot proceed")
+        print(msg + " skipping")
+        return None
+    return value
+
+
+def _read_local_bytes(path: Path) -> bytes:
+    """Read a local file using a single fstat and, usually, a single read call."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)
+        if len(data) > size:
+            # File grew since fstat, read the remainder
+            chunks = [data]
+            while chunk := os.read(fd, 65536):
+                chunks.append(chunk)
+            data = b"".join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+
+def _all_subclasses(cls: Type[Any]) -> Set[Type[Any]]:
+    """Recursively collect all subclasses of a class."""
+    subclasses = set(cls.__subclasses__())
+    for subclass in cls.__subclasses__():
+        subclasses |= _all_subclasses(subclass)
+    return subclasses
+
+
+def _load_provider_module(
+    provider_name: str, file_path: Path
+) -> Optional[Tuple[Type[BaseLlmModel], ModuleType]]:
+    """Dynamically load a provider module from a file path
+
+    Returns:
+        The provider class and its module, or None if no provider class was found.
+    """
+    # Create a module spec and load the module
+    spec = importlib.util.spec_from_file_location(
+        f"custom_provider_{provider_name}", file_path
+    )
+    if not spec or not spec.loader:
+        print(f"Failed to create module spec for {provider_name}")
+        return None
+
+    module = importlib.util.module_from_spec(spec)
+    existing_classes = _all_subclasses(BaseLlmModel)
+    spec.loader.exec_module(module)
+
+    # The provider class is the concrete BaseLlmModel subclass the module defined
+    new_classes = _all_subclasses(BaseLlmModel) - existing_classes
+    for candidate_class in sorted(new_classes, key=lambda c: c.__qualname__):
+        if not inspect.isabstract(candidate_class):
+            return candidate_class, module
+
+    print(f"No valid provider class found in module {provider_name}")
+    return None
+
+
+@cache
+def _load_custom_providers() -> (
+    Tuple[Dict[str, Type[BaseLlmModel]], Dict[str, ModuleType]]
+):
+    """Load custom provider modules from S3, once per process.
+
+    Returns:
+        A tuple of the provider key to model class mapping and the provider key
+        to loaded module mapping.
+    """
+    registry: Dict[str, Type[BaseLlmModel]] = {}
+    modules: Dict[str, ModuleType] = {}
+
+    # Get S3 directory for provider modules
+    s3_provider_path = _resolve_ssm_s3_dir(
+        env.SSM_PROVIDER_PATH_PARAMETER, what="provider modules", required=False
+    )
+    if not s3_provider_path:
+        return registry, modules
+
+    try:
+        provider_objects = _list_s3_dir(s3_provider_path, ".py")
+    except NotADirectoryError as e:
+        print(e)
+        return registry, modules
+    if not provider_objects:
+        print(f"No provider modules found in S3 path '{s3_provider_path}'.")
+        return registry, modules
+
+    # Download S3 provider modules directly into the src/models/ directory
+    models_dir = Path(__file__).parent / "models"
+    models_dir.mkdir(exist_ok=True)
+
+    # Download all Python files from S3, then load them one by one
+    bucket, _ = _parse_s3_dir(s3_provider_path)
+    sources = _s3_bulk_read(bucket, [obj["Key"] for obj in provider_objects])
+    for key, source in sources.items():
+        provider_name = PurePosixPath(key).stem
+        local_file_path = models_dir / f"{provider_name}.py"
+        local_file_path.write_bytes(source)
+        loaded = _load_provider_module(provider_name, local_file_path)
+        if loaded:
+            provider_key = provider_name.lower()
+            registry[provider_key], modules[provider_key] = loaded
+            print(f"Successfully registered custom provider: {provider_key}")
+
+    return registry, modules
 
 
 class ModelFactory:
-    """A singleton factory class for dynamically creating and managing language model instances."""
+    """A factory class for dynamically creating and managing language model instances.
+
+    Use `ModelFactory.get(local_path)` to obtain a factory; one instance is created
+    and loaded per distinct configuration path.
+    """
 
-    _instance = None
     # Provider type (str) to model class mapping
     _model_type_registry: Dict[str, Type[BaseLlmModel]] = {}
     # Custom provider modules loaded from S3
-    _custom_provider_modules = {}
-
-    def __new__(cls, local_path: str):
-        if cls._instance is None:
-            cls._instance = super(ModelFactory, cls).__new__(cls)
-            # Register built-in providers
-            if not cls._model_type_registry:
-                cls._model_type_registry = {
-                    Provider.BEDROCK.value: LangChainBedrockModel,
-                    Provider.OPENAI.value: LangChainOpenAIModel,
-                }
-            cls._instance._all_models_config = None
-            # Load custom provider modules from S3
-            cls._instance._load_custom_providers()
-            cls._instance.load_configurations(local_path)
-
-        return cls._instance
+    _custom_provider_modules: Dict[str, ModuleType] = {}
+
+    def __init__(self) -> None:
+        self._all_models_config: Optional[AllModelsConfig] = None
 
     @classmethod
-    def reset(cls) -> None:
-        """Reset the factory singleton and clear dynamic providers.
+    @lru_cache(maxsize=None)
+    def get(cls, local_path: str) -> "ModelFactory":
+        """Get the factory for a configuration path, loading it on first use.
+
+        Args:
+            local_path: The local path to a folder containing a yaml file for each model.
 
-        Next instantiation will reload built-in providers, custom providers from S3,
-        and model configurations.
+        Returns:
+            ModelFactory: The loaded factory, shared by all callers using the same path.
         """
-        cls._instance = None
-        # Clear dynamic providers; keep empty so __new__ rebuilds with built-ins
-        cls._model_type_registry = {}
-        cls._custom_provider_modules = {}
+        if env.LLM_RESPONSE_CACHE:
+            enable_response_cache(env.LLM_RESPONSE_CACHE)
 
-    def _fetch_ssm_parameter(self, parameter_name: str, required: bool = False) -> str:
-        """Fetch a parameter value from SSM Parameter Store
+        custom_providers, custom_modules = _load_custom_providers()
+        cls._model_type_registry = {**BUILTIN_PROVIDERS, **custom_providers}
+        cls._custom_provider_modules = custom_modules
 
-        Args:
-            parameter_name: The name of the SSM parameter
-            required: If True, raises an exception when parameter cannot be retrieved
+        factory = cls()
+        factory.load_configurations(local_path)
+        return factory
 
-        Returns:
-            The parameter value or empty string if not found and not required
+    @classmethod
+    def reset(cls) -> None:
+        """Drop all cached factories, custom providers and shared LangChain models.
+
+        Next call to `get` will reload custom providers from S3, re-list the local
+        config directories and reload model configurations. Models are rebuilt (and
+        their API keys re-fetched) on next use, and `get_llm` stops serving instances
+        built from the old configuration.
         """
+        _llm_instances.clear()
+        cls.get.cache_clear()
+        _load_custom_providers.cache_clear()
+        clear_glob_cache()
+        clear_llm_cache()
+        cls._model_type_registry = {}
+        cls._custom_provider_modules = {}
+
+    def _load_and_validate_configs(self, raw_configs: dict) -> AllModelsConfig:
+        """Validates raw configs with Pydantic, resolving interpolations if present."""
         try:
-            ssm_client = boto3.client("ssm")
-            response = ssm_client.get_parameter(
-                Name=parameter_name,
-                WithDecryption=True,
-            )
-            return response.get("Parameter", {}).get("Value", "")
-        except Exception as e:
-            error_msg = f"Failed to load parameter '{parameter_name}' from SSM: {e}"
-            if required:
-                raise ModelConfigurationError(error_msg)
-            print(f"Warning: {error_msg}")
-            return ""
-
-    def _resolve_ssm_s3_dir(
-        self, param_name: Optional[str], *, what: str, required: bool
-    ) -> Optional[str]:
-        """Resolve an SSM parameter (whose name is provided in env) into an S3 dir path.
+            # Only round-trip through OmegaConf when there is something to resolve
+            dict_configs: Any = raw_configs
+            if _has_interpolation(raw_configs):
+                from omegaconf import OmegaConf
 
-        Args:
-            param_name: Name of the SSM parameter to look up (from environment).
-            what: Human description of what this S3 path is for (e.g., "provider modules").
-            required: If True, raise ModelConfigurationError when unavailable/empty; otherwise, log and return None.
+                dict_configs = OmegaConf.to_container(
+                    OmegaConf.create(raw_configs), resolve=True
+                )
+        except Exception as e:
+            raise ModelConfigurationError(f"Error processing configurations: {e}")
 
-        Returns:
-            The S3 directory path string if available, else None.
-        """
-        if not param_name:
-            msg = f"SSM parameter name for {what} not set in env;"
-            if required:
-                raise ModelConfigurationError(f"{msg} cannot proceed")
-            print(f"{msg} skipping")
-            return None
+        # Validate each model on its own so errors point at the offending config
+        models: Dict[str, ModelConfig] = {}
+        for model_name_key, model_raw_config in dict_configs["models"].items():
+            try:
+                models[model_name_key] = MODEL_CONFIG_ADAPTER.validate_python(
+                    model_raw_config
+                )
+            except ValidationError as e:
+                raise ModelConfigurationError(
+                    f"Configuration validation failed for '{model_name_key}': {e}"
+                )
+        # Values are already validated ModelConfig instances
+        return AllModelsConfig.model_construct(models=models)
 
-        value = self._fetch_ssm_parameter(param_name, required=required)
-        if not value:
-            msg = f"SSM parameter '{param_name}' for {what} returned empty;"
-            if required:
-                raise ModelConfigurationError(msg + " cannot proceed")
-            print(msg + " skipping")
+    def _config_cache_file(self, config_root: Path) -> Optional[Path]:
+        """Returns where to cache the configurations of `config_root`, if enabled."""
+        if not env.LLM_CONFIG_CACHE_ENABLED:
             return None
-        return value
+        if not env.LLM_CONFIG_CACHE_DIR:
+            return config_root / CONFIG_CACHE_FILE
 
-    def _load_custom_providers(self):
-        """Load custom provider modules from S3"""
-        # Get S3 directory for provider modules
-        s3_provider_path = self._resolve_ssm_s3_dir(
-            env.SSM_PROVIDER_PATH_PARAMETER, what="provider modules", required=False
-        )
-        if not s3_provider_path:
-            return
+        # A shared cache directory holds one file per configuration directory
+        root_digest = hashlib.blake2b(
+            str(config_root.resolve()).encode(), digest_size=8
+        ).hexdigest()
+        return Path(env.LLM_CONFIG_CACHE_DIR) / f"llm_factory_cache_{root_digest}.json"
 
-        # Download S3 provider modules directly into the src/models/ directory
-        models_dir = Path(__file__).parent / "models"
-        models_dir.mkdir(exist_ok=True)
-        s3_dir = S3Path(s3_provider_path)
-        if not s3_dir.is_dir():
-            print(f"S3 provider path '{s3_provider_path}' is not a directory.")
-            return
+    def _config_cache_key(
+        self, config_root: Path, s3_objects: List["ObjectTypeDef"]
+    ) -> Optional[str]:
+        """Fingerprints the local YAML files by mtime and the S3 ones by ETag.
 
-        # Download all Python files from S3
-        for py_file in s3_dir.glob("*.py"):
-            provider_name = py_file.stem
-            local_file_path = models_dir / f"{provider_name}.py"
-            local_file_path.write_text(py_file.read_text())
-            self._load_provider_module(provider_name, local_file_path)
-
-    def _load_provider_module(self, provider_name: str, file_path: str):
-        """Dynamically load a provider module from a file path"""
-        # Create a module spec and load the module
-        spec = importlib.util.spec_from_file_location(
-            f"custom_provider_{provider_name}", file_path
-        )
-        if not spec or not spec.loader:
-            print(f"Failed to create module spec for {provider_name}")
-            return
+        S3 objects are fingerprinted from the listing also used to download them,
+        without a request per file.
 
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        Returns:
+            The cache key, or None if the files could not be fingerprinted.
+        """
+        try:
+            digest = hashlib.blake2b()
+            if config_root.is_dir():
+                for yaml_file in glob_cached(config_root):
+                    mtime_ns = yaml_file.stat().st_mtime_ns
+                    digest.update(f"{yaml_file}:{mtime_ns};".encode())
+            for s3_object in s3_objects:
+                digest.update(f"s3:{s3_object['Key']}:{s3_object['ETag']};".encode())
+            return digest.hexdigest()
+        except Exception as e:
+            # The cache is only an optimization; never let it break loading
+            print(f"Warning: Could not fingerprint configurations, skipping cache: {e}")
+            return None
 
-        # Find the provider class in the module (should implement BaseLlmModel)
-        for attr_name in dir(module):
-            candidate_class = getattr(module, attr_name)
-            is_valid_provider_class = (
-                isinstance(candidate_class, type)
-                and candidate_class is not BaseLlmModel
-                and issubclass(candidate_class, BaseLlmModel)
-            )
-            if is_valid_provider_class:
-                provider_key = provider_name.lower()
-                self._model_type_registry[provider_key] = candidate_class
-                self._custom_provider_modules[provider_key] = module
-                print(f"Successfully registered custom provider: {provider_key}")
-                break
-        else:
-            print(f"No valid provider class found in module {provider_name}")
-
-    def _load_and_validate_configs(self, raw_configs: DictConfig) -> AllModelsConfig:
-        """Loads raw OmegaConf DictConfig and validates it with Pydantic."""
+    def _read_config_cache(
+        self, cache_file: Path, cache_key: str
+    ) -> Optional[AllModelsConfig]:
+        """Returns the cached configurations if the cache file matches the key."""
         try:
-            dict_configs = OmegaConf.to_container(raw_configs, resolve=True)
-            return AllModelsConfig.model_validate(dict_configs)
-        except ValidationError as e:
-            raise ModelConfigurationError(f"Configuration validation failed: {e}")
+            cached = json.loads(cache_file.read_text())
+            if cached.get("key") != cache_key:
+                return None
+            return AllModelsConfig.model_validate_json(cached["payload"])
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            raise ModelConfigurationError(f"Error processing configurations: {e}")
+            print(f"Warning: Ignoring unreadable config cache '{cache_file}': {e}")
+            return None
+
+    def _write_config_cache(
+        self, cache_file: Path, cache_key: str, configs: AllModelsConfig
+    ) -> None:
+        """Writes the validated configurations to the cache file."""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(
+                json.dumps(
+                    {
+                        "key": cache_key,
+                        "payload": configs.model_dump_json(by_alias=True),
+                    }
+                )
+            )
+        except OSError as e:
+            print(f"Warning: Could not write config cache '{cache_file}': {e}")
 
     def load_configurations(self, source_path: str):
-        """Loads model configurations from various sources and validates them."""
+        """Loads model configurations from various sources and validates them.
+
+        Validated configurations are cached (next to the local YAML files unless
+        `LLM_CONFIG_CACHE_DIR` is set) and reused as long as no local or S3 YAML file
+        has been added, removed or modified. Configurations using `${...}`
+        interpolation are never cached, since their resolved values may depend on the
+        environment.
+        """
         print(f"Loading configurations from: {source_path}")
-        local_config = self._load_local_config(Path(source_path))
+        config_root = Path(source_path)
 
         # Resolve S3 directory for model yaml configs
-        s3_models_path = self._resolve_ssm_s3_dir(
+        s3_models_path = _resolve_ssm_s3_dir(
             env.SSM_MODELS_PATH_PARAMETER, what="model configs", required=True
         )
-        remote_config = self._load_s3_config(s3_models_path)
-        raw_configs = OmegaConf.merge(local_config, remote_config)
 
-        if not raw_configs:
+        s3_objects: List["ObjectTypeDef"] = []
+        if s3_models_path:
+            try:
+                s3_objects = _list_s3_dir(s3_models_path, ".yaml")
+            except Exception as e:
+                raise ModelConfigurationError(
+                    f"Failed to list model configs in S3 directory {s3_models_path}: {e}"
+                )
+
+        cache_file = self._config_cache_file(config_root)
+        cache_key = self._config_cache_key(config_root, s3_objects)
+        cached_config = (
+            self._read_config_cache(cache_file, cache_key)
+            if cache_file and cache_key
+            else None
+        )
+        if cached_config is not None:
+            self._all_models_config = cached_config
+            model_count = len(self._all_models_config.models)
+            print(f"Loaded {model_count} model configurations from cache.")
+            return
+
+        local_models = self._load_local_config(config_root)
+        remote_models = self._load_s3_config(s3_models_path, s3_objects)
+        # Remote configs take precedence over local ones with the same key
+        merged_models = {**local_models, **remote_models}
+
+        if not merged_models:
             raise ModelConfigurationError(
-                f"No 'models' section found in configurations from {source_path}"
+                f"No model configurations found in configurations from {source_path}"
             )
 
+        raw_configs = {"models": merged_models}
         self._all_models_config = self._load_and_validate_configs(raw_configs)
         model_count = len(self._all_models_config.models)
         print(f"Successfully loaded {model_count} model configurations.")
+        if cache_file and cache_key and not _has_interpolation(raw_configs):
+            self._write_config_cache(cache_file, cache_key, self._all_models_config)
 
-    def _load_yaml_configs_from_path(self, path: Path, path_desc: str) -> DictConfig:
-        """Loads configurations from YAML files in a directory (local or S3)."""
-        all_raw_configs = OmegaConf.create({"models": {}})
-        try:
-            if not path.is_dir():
-                raise ModelConfigurationError(
-                    f"{path_desc} '{path}' is not a directory."
-                )
+    def _load_yaml_configs(
+        self, yaml_files: Iterable[Tuple[str, Union[str, bytes]]], source_desc: str
+    ) -> Dict[str, dict]:
+        """Parses YAML model configurations.
 
-            for yaml_file in path.glob("*.yaml"):
-                model_raw_config = OmegaConf.create(yaml_file.read_text())
-                model_name_key = yaml_file.stem
-                all_raw_configs.models[model_name_key] = model_raw_config
+        Args:
+            yaml_files: (model name key, YAML content) pairs.
+            source_desc: Human description of where the files come from, for errors.
 
-            return all_raw_configs
+        Returns:
+            A mapping of model name key to its raw config.
+        """
+        try:
+            return {
+                model_name_key: yaml.load(content, Loader=YamlLoader)
+                for model_name_key, content in yaml_files
+            }
         except Exception as e:
             raise ModelConfigurationError(
-                f"An unexpected error occurred loading yaml config from {path_desc} {path}: {e}"
+                f"An unexpected error occurred loading yaml config from {source_desc}: {e}"
+            )
+
+    def _load_local_config(self, config_root: Path) -> Dict[str, dict]:
+        """Loads configurations from YAML files in a local directory."""
+        if not config_root.is_dir():
+            raise ModelConfigurationError(
+                f"local directory '{config_root}' is not a directory."
             )
 
-    def _load_local_config(self, config_root: Path) -> DictConfig:
-        """Loads configurations from a local YAML file using OmegaConf."""
-        return self._load_yaml_configs_from_path(config_root, "local directory")
+        yaml_files = (
+            (yaml_file.stem, _read_local_bytes(yaml_file))
+            for yaml_file in glob_cached(config_root)
+        )
+        return self._load_yaml_configs(yaml_files, f"local directory {config_root}")
 
-    def _load_s3_config(self, s3_path_prefix: str) -> DictConfig:
-        """Loads configurations from multiple YAML files within an S3 directory."""
+    def _load_s3_config(
+        self, s3_path_prefix: Optional[str], s3_objects: List["ObjectTypeDef"]
+    ) -> Dict[str, dict]:
+        """Loads configurations from the listed YAML files within an S3 directory."""
         if not s3_path_prefix:
             print("No S3 models path configured, skipping S3 model loading")
-            return OmegaConf.create({"models": {}})
+            return {}
+
+        bucket, _ = _parse_s3_dir(s3_path_prefix)
+        try:
+            contents = _s3_bulk_read(bucket, [obj["Key"] for obj in s3_objects])
+        except Exception as e:
+            raise ModelConfigurationError(
+                f"Failed to download model configs from S3 directory {s3_path_prefix}: {e}"
+            )
 
-        s3_dir = S3Path(s3_path_prefix)
-        return self._load_yaml_configs_from_path(s3_dir, "S3 directory")
+        yaml_files = ((PurePosixPath(key).stem, data) for key, data in contents.items())
+        return self._load_yaml_configs(yaml_files, f"S3 directory {s3_path_prefix}")
 
     def get_model_instance(self, model_name: str) -> BaseLlmModel:
         """Retrieves an instantiated model based on its configuration key."""
@@ -236,14 +565,8 @@ class ModelFactory:
         if not model_config:
             raise ModelNotFoundError(f"Config for '{model_name}' not found.")
 
-        # Get provider value (either from enum or string for custom providers)
-        provider_key = (
-            model_config.provider.value
-            if isinstance(model_config.provider, Provider)
-            else model_config.provider
-        )
-        # Normalize to lowercase for registry lookup
-        provider_key = provider_key.lower()
+        # Provider is normalized to a lowercase registry key during validation
+        provider_key = model_config.provider
         model_class = ModelFactory._model_type_registry.get(provider_key)
 
         if not model_class:
@@ -254,14 +577,10 @@ class ModelFactory:
         return model_class(name=model_config.name, config=model_config)
 
 
-def _get_llm_cached(model_name_key: str, local_path: str) -> BaseLlmModel:
-    factory = ModelFactory(local_path)
-    return factory.get_model_instance(model_name_key)
-
-
-@lru_cache(maxsize=128)
-def _get_llm_lru(model_name_key: str, local_path: str) -> BaseLlmModel:
-    return _get_llm_cached(model_name_key, local_path)
+# Models handed out by get_llm, kept only while callers still reference them
+_llm_instances: "weakref.WeakValueDictionary[Tuple[str, str], BaseLlmModel]" = (
+    weakref.WeakValueDictionary()
+)
 
 
 def get_llm(
@@ -281,7 +600,12 @@ def get_llm(
         BaseLlmModel: The instantiated LLM model.
     """
     if force_reload:
-        # Clear cached instances and reset the factory so providers/configs reload
-        _get_llm_lru.cache_clear()
+        # Reset the factory (and tracked instances) so providers/configs reload
         ModelFactory.reset()
-    return _get_llm_lru(model_name_key, str(local_path))
+
+    key = (model_name_key, str(local_path))
+    model = _llm_instances.get(key)
+    if model is None:
+        model = ModelFactory.get(key[1]).get_model_instance(model_name_key)
+        _llm_instances[key] = model
+    return model
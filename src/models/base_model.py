@@ -1,9 +1,19 @@
 from abc import ABC, abstractmethod
+from functools import cached_property
+from typing import Dict, Hashable, Tuple
 
 from langchain_core.language_models import BaseChatModel
 
 from config_models import ModelConfig
 
+# Underlying LangChain chat models shared by all wrappers with the same cache key
+_LLM_CACHE: Dict[Tuple[Hashable, ...], BaseChatModel] = {}
+
+
+def clear_llm_cache() -> None:
+    """Drop all shared LangChain chat models so they are rebuilt on next use."""
+    _LLM_CACHE.clear()
+
 
 class BaseLlmModel(ABC):
     """Abstract Base Class for all language models, wrapping LangChain's BaseChatModel.
@@ -26,7 +36,26 @@ class BaseLlmModel(ABC):
         """
         self.name = name
         self.config = config
-        self._llm: BaseChatModel = self._initialize_llm()
+
+    def _llm_cache_key(self) -> Tuple[Hashable, ...]:
+        """Returns the key under which the underlying LangChain LLM is shared.
+
+        Wrappers of the same class whose configurations agree on every field used to
+        build the LLM reuse a single instance. Subclasses whose `_initialize_llm`
+        depends on other state should extend this key.
+
+        Returns:
+            Tuple[Hashable, ...]: The cache key for this model's LLM.
+        """
+        return (
+            type(self),
+            self.config.model_id,
+            self.config.temperature,
+            self.config.max_tokens,
+            self.config.region_name,
+            self.config.api_key_secret_name,
+            self.config.api_key_env_var,
+        )
 
     @abstractmethod
     def _initialize_llm(self) -> BaseChatModel:
@@ -39,16 +68,26 @@ class BaseLlmModel(ABC):
         """
         pass
 
-    @property
+    @cached_property
     def llm(self) -> BaseChatModel:
         """Provides direct access to the underlying LangChain BaseChatModel instance.
 
-        This allows users to leverage full LangChain capabilities directly.
+        This allows users to leverage full LangChain capabilities directly. The LLM is
+        built (or fetched from the shared cache) on first access.
 
         Returns:
             BaseChatModel: The wrapped LangChain BaseChatModel instance.
         """
-        return self._llm
+        cache_key = self._llm_cache_key()
+        llm = _LLM_CACHE.get(cache_key)
+        if llm is None:
+            llm = _LLM_CACHE.setdefault(cache_key, self._initialize_llm())
+        return llm
+
+    @property
+    def _llm(self) -> BaseChatModel:
+        """Alias of `llm` kept for provider subclasses that use `self._llm`."""
+        return self.llm
 
     def invoke(self, prompt: str, **kwargs) -> str:
         """Generates a response for a given prompt using the wrapped LangChain LLM.
@@ -61,10 +100,12 @@ class BaseLlmModel(ABC):
             str: The generated response from the LLM.
         """
         print(f"[{self.name}] Invoking LangChain LLM...")
+        # Built outside the try so configuration errors (e.g. a missing API key) raise
+        llm = self.llm
         try:
             # LangChain's invoke method takes a string or a list of messages
             # For simplicity, we'll use string input here.
-            return self._llm.invoke(prompt, **kwargs)
+            return llm.invoke(prompt, **kwargs)
         except Exception as e:
             return f"Error calling {self.name} via LangChain: {e}"
 
@@ -85,5 +126,7 @@ class BaseLlmModel(ABC):
         return token_cost
 
     def __repr__(self):
-        """Returns a string representation of the model."""
-        return f"{self.__class__.__name__}(name='{self.name}', llm_type='{self._llm.__class__.__name__}')"
+        """Returns a string representation of the model without building the LLM."""
+        llm = self.__dict__.get("llm")
+        llm_type = llm.__class__.__name__ if llm is not None else "<not initialized>"
+        return f"{self.__class__.__name__}(name='{self.name}', llm_type='{llm_type}')"
@@ -1,4 +1,6 @@
 import os
+from functools import cache
+from typing import TYPE_CHECKING
 
 import boto3
 from langchain_core.language_models import BaseChatModel
@@ -8,6 +10,16 @@ from config_models import ModelConfig
 
 from models.base_model import BaseLlmModel
 
+if TYPE_CHECKING:
+    from mypy_boto3_secretsmanager import SecretsManagerClient
+
+
+@cache
+def _secrets_client() -> "SecretsManagerClient":
+    """Lazily create the Secrets Manager client shared by all OpenAI models."""
+    return boto3.client("secretsmanager")
+
+
 class LangChainOpenAIModel(BaseLlmModel):
     """Concrete implementation for OpenAI chat models using LangChain's ChatOpenAI."""
 
@@ -20,8 +32,7 @@ class LangChainOpenAIModel(BaseLlmModel):
         api_key = None
         if self.config.api_key_secret_name:
             try:
-                secrets_client = boto3.client("secretsmanager")
-                response = secrets_client.get_secret_value(
+                response = _secrets_client().get_secret_value(
                     SecretId=self.config.api_key_secret_name
                 )
                 api_key = response["SecretString"]
@@ -0,0 +1,30 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
+
+
+@lru_cache(maxsize=32)
+def _glob_cached(directory: Path, pattern: str, mtime_ns: int) -> Tuple[Path, ...]:
+    """Glob a directory; `mtime_ns` only serves to invalidate the cached listing."""
+    return tuple(sorted(directory.glob(pattern)))
+
+
+def glob_cached(directory: Path, pattern: str = "*.yaml") -> Tuple[Path, ...]:
+    """Glob a local directory, reusing the last listing while it is unchanged.
+
+    Listings are keyed by the directory mtime, which changes whenever an entry is
+    added, removed or renamed.
+
+    Args:
+        directory: The local directory to list.
+        pattern: The glob pattern to match files against.
+
+    Returns:
+        The matching paths, sorted.
+    """
+    return _glob_cached(directory, pattern, directory.stat().st_mtime_ns)
+
+
+def clear_glob_cache() -> None:
+    """Forget all cached directory listings."""
+    _glob_cached.cache_clear()
@@ -0,0 +1,142 @@
+import boto3
+import pytest
+from moto import mock_aws
+
+import model_factory
+from config_models import env
+from model_factory import CONFIG_CACHE_FILE, ModelFactory, get_llm
+
+BUCKET = "llm-config"
+S3_MODELS_DIR = f"/{BUCKET}/models/"
+
+LOCAL_MODEL_YAML = """\
+name: Local Model
+provider: bedrock
+model_id: local-model
+region_name: us-east-1
+"""
+
+REMOTE_MODEL_YAML = """\
+name: Remote Model
+provider: openai
+model_id: remote-model
+"""
+
+
+def _load(local_path):
+    """Load a fresh factory for `local_path`."""
+    ModelFactory.reset()
+    return ModelFactory.get(str(local_path))
+
+
+@pytest.fixture
+def aws(monkeypatch):
+    """Mocked AWS with an SSM parameter pointing at an S3 models directory."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setattr(env, "SSM_PROVIDER_PATH_PARAMETER", None)
+    # Cached clients must be created inside the mock
+    model_factory._ssm_client.cache_clear()
+    model_factory._s3_client.cache_clear()
+    with mock_aws():
+        boto3.client("ssm").put_parameter(
+            Name=env.SSM_MODELS_PATH_PARAMETER, Value=S3_MODELS_DIR, Type="String"
+        )
+        s3 = boto3.client("s3")
+        s3.create_bucket(Bucket=BUCKET)
+        s3.put_object(
+            Bucket=BUCKET, Key="models/remote_model.yaml", Body=REMOTE_MODEL_YAML
+        )
+        yield s3
+    ModelFactory.reset()
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    (tmp_path / "local_model.yaml").write_text(LOCAL_MODEL_YAML)
+    return tmp_path
+
+
+def test_get_memoizes_factory_per_path(aws, config_dir, tmp_path_factory):
+    other_dir = tmp_path_factory.mktemp("other")
+    (other_dir / "other_model.yaml").write_text(LOCAL_MODEL_YAML)
+
+    factory = _load(config_dir)
+
+    assert ModelFactory.get(str(config_dir)) is factory
+    other_models = ModelFactory.get(str(other_dir))._all_models_config.models
+    assert set(other_models) == {"other_model", "remote_model"}
+
+
+def test_load_configurations_merges_local_and_s3(aws, config_dir):
+    factory = _load(config_dir)
+
+    models = factory._all_models_config.models
+    assert set(models) == {"local_model", "remote_model"}
+    assert models["remote_model"].name == "Remote Model"
+
+
+def test_unchanged_configs_are_served_from_cache(aws, config_dir, monkeypatch):
+    _load(config_dir)
+    assert (config_dir / CONFIG_CACHE_FILE).exists()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("configs should have been served from cache")
+
+    monkeypatch.setattr(ModelFactory, "_load_local_config", fail)
+    monkeypatch.setattr(ModelFactory, "_load_s3_config", fail)
+    factory = _load(config_dir)
+
+    models = factory._all_models_config.models
+    assert set(models) == {"local_model", "remote_model"}
+    assert models["local_model"].input_token_cost == 0.0
+
+
+def test_s3_changes_invalidate_cache(aws, config_dir):
+    _load(config_dir)
+    aws.put_object(
+        Bucket=BUCKET,
+        Key="models/remote_model.yaml",
+        Body=REMOTE_MODEL_YAML.replace("Remote Model", "Updated Model"),
+    )
+
+    factory = _load(config_dir)
+
+    assert factory._all_models_config.models["remote_model"].name == "Updated Model"
+
+
+def test_interpolated_configs_are_not_cached(aws, config_dir, monkeypatch):
+    (config_dir / "local_model.yaml").write_text(
+        LOCAL_MODEL_YAML + "description: ${oc.env:LLM_TEST_DESCRIPTION}\n"
+    )
+    monkeypatch.setenv("LLM_TEST_DESCRIPTION", "first")
+    _load(config_dir)
+    assert not (config_dir / CONFIG_CACHE_FILE).exists()
+
+    monkeypatch.setenv("LLM_TEST_DESCRIPTION", "second")
+    factory = _load(config_dir)
+
+    assert factory._all_models_config.models["local_model"].description == "second"
+
+
+def test_cache_can_be_moved_or_disabled(aws, config_dir, tmp_path_factory, monkeypatch):
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setattr(env, "LLM_CONFIG_CACHE_DIR", str(cache_dir))
+    _load(config_dir)
+    assert not (config_dir / CONFIG_CACHE_FILE).exists()
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    monkeypatch.setattr(env, "LLM_CONFIG_CACHE_ENABLED", False)
+    monkeypatch.setattr(env, "LLM_CONFIG_CACHE_DIR", None)
+    _load(config_dir)
+    assert not (config_dir / CONFIG_CACHE_FILE).exists()
+
+
+def test_reset_drops_tracked_get_llm_instances(aws, config_dir):
+    model = get_llm("local_model", str(config_dir))
+    assert get_llm("local_model", str(config_dir)) is model
+
+    ModelFactory.reset()
+
+    assert get_llm("local_model", str(config_dir)) is not model